@@ -21,6 +21,7 @@ RELEASES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "release
 RPI_INIT_FP = "/Volumes/RPI-RP2"
 RPI_CIRCUITPYTHON_PATHS = ["/Volumes/CIRCUITPY", "/Volumes/LUMAFADER", "/Volumes/LUMA"]
 TIMEOUT_THRESHOLD = 80  # seconds
+RETRY_INTERVAL_S = 0.2  # mount polling interval; volumes typically appear in 0.5-1s
 
 def flash_uf2(nuke_fp, uf2_fp, nuke=True):
     time_prev = time.monotonic()
@@ -44,15 +45,20 @@ def flash_uf2(nuke_fp, uf2_fp, nuke=True):
             ready_for_copy = True
             print("copied uf2 to RPI-RP2")
             time_prev = time.monotonic()
-        except:
-            print("Retrying in 2s...")
-            time.sleep(2)
+        except OSError:
+            time.sleep(RETRY_INTERVAL_S)
 
         if time.monotonic() - time_prev > TIMEOUT_THRESHOLD:
             print("Timeout")
             return False
 
-    time.sleep(10)
+    # Wait for CircuitPython to boot and mount its volume
+    print("Waiting for CircuitPython to boot...")
+    while find_circuitpy_path() is None:
+        if time.monotonic() - time_prev > TIMEOUT_THRESHOLD:
+            print("Timeout")
+            return False
+        time.sleep(RETRY_INTERVAL_S)
     return True
 
 def find_circuitpy_path():
@@ -68,23 +74,24 @@ def copy_src_files(src_folder):
     print(f"  Looking for: {RPI_CIRCUITPYTHON_PATHS}")
     print(f"  Current volumes: {os.listdir('/Volumes/')}")
     time_prev = time.monotonic()
+    last_error = None
     while not success:
         try:
             target = find_circuitpy_path()
-            print(f"  find_circuitpy_path() returned: {target}")
             if target:
                 print(f"  Copying files to {target}...")
                 count = 0
+                # Per-file copy2 so the first failure retries (copytree defers
+                # errors until every file is written). Sorted walk for a
+                # reproducible copy order; one makedirs per directory.
                 for root, dirs, files in os.walk(src_folder):
-                    dirs[:] = [d for d in dirs if d != '__pycache__']
-                    for f in files:
-                        if f == '__pycache__':
-                            continue
-                        src_file = os.path.join(root, f)
-                        rel_path = os.path.relpath(src_file, src_folder)
-                        dst_file = os.path.join(target, rel_path)
-                        os.makedirs(os.path.dirname(dst_file), exist_ok=True)
-                        shutil.copy2(src_file, dst_file)
+                    dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+                    rel_root = os.path.relpath(root, src_folder)
+                    dst_root = os.path.join(target, rel_root)
+                    os.makedirs(dst_root, exist_ok=True)
+                    for f in sorted(files):
+                        rel_path = os.path.normpath(os.path.join(rel_root, f))
+                        shutil.copy2(os.path.join(root, f), os.path.join(dst_root, f))
                         count += 1
                         print(f"    [{count}] {rel_path}")
                 success = True
@@ -92,9 +99,12 @@ def copy_src_files(src_folder):
                 time_prev = time.monotonic()
             else:
                 raise FileNotFoundError("No matching volume found")
-        except Exception as e:
-            print(f"Retrying in 2s... ({e})")
-            time.sleep(2)
+        except OSError as e:
+            # Print each distinct failure once; polling is too fast to log every retry
+            if str(e) != last_error:
+                last_error = str(e)
+                print(f"Retrying... ({e})")
+            time.sleep(RETRY_INTERVAL_S)
 
         if time.monotonic() - time_prev > TIMEOUT_THRESHOLD * 2:
             print("Timeout")
@@ -137,11 +147,15 @@ def find_release_assets(dest, tag):
     future CircuitPython version bump won't break this.
     """
     zip_path = os.path.join(dest, f"LumaFader-{tag}.zip")
-    uf2s = [f for f in os.listdir(dest) if f.lower().endswith(".uf2")]
-    nuke = next((f for f in uf2s if "nuke" in f.lower()), None)
-    cpy = next((f for f in uf2s if "nuke" not in f.lower()), None)
-    nuke_fp = os.path.join(dest, nuke) if nuke else None
-    cpy_fp = os.path.join(dest, cpy) if cpy else None
+    with os.scandir(dest) as it:
+        uf2s = sorted(
+            (e for e in it if e.is_file() and e.name.lower().endswith(".uf2")),
+            key=lambda e: e.name,
+        )
+    nuke = next((e for e in uf2s if "nuke" in e.name.lower()), None)
+    cpy = next((e for e in uf2s if "nuke" not in e.name.lower()), None)
+    nuke_fp = nuke.path if nuke else None
+    cpy_fp = cpy.path if cpy else None
     return zip_path, nuke_fp, cpy_fp
 
 
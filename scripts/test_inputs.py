@@ -0,0 +1,161 @@
+"""
+Unit tests for BankButton (inputs.py) timing. Runs ON-DEVICE (CircuitPython,
+copy to the Pico and run in Thonny) and OFF-DEVICE (plain CPython) with a
+fake pin and a fake millisecond clock.
+
+Off-device (CPython):
+    python3 scripts/test_inputs.py
+On-device (CircuitPython / Thonny):
+    copy this file to the device alongside inputs.py etc. and run it
+    (or: >>> import test_inputs)
+"""
+
+import sys
+
+# Off-device (CPython) only: add src/ to the path and cd into it so
+# settings.json resolves. See test_record_engine.py.
+try:
+    import os
+    SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    os.chdir(SRC_DIR)
+    sys.path.insert(0, SRC_DIR)
+except (AttributeError, NameError):
+    pass  # CircuitPython: no os.path/os.chdir/__file__ - imports resolve directly
+
+# Off-device only: minimal stand-ins for the CircuitPython modules inputs.py
+# imports. On the device the real digitalio/adafruit_debouncer/adafruit_ticks
+# are used; only the pin and the clock are faked.
+try:
+    import digitalio
+except ImportError:
+    class _Namespace:
+        pass
+
+    digitalio = _Namespace()
+    digitalio.Direction = _Namespace()
+    digitalio.Direction.INPUT = "input"
+    digitalio.Pull = _Namespace()
+    digitalio.Pull.UP = "up"
+    sys.modules["digitalio"] = digitalio
+
+    class _Debouncer:
+        """Stateful like adafruit_debouncer: initial state comes from the pin."""
+        def __init__(self, pin):
+            self._pin = pin
+            self.value = pin.value
+            self.fell = False
+            self.rose = False
+
+        def update(self):
+            new_value = self._pin.value
+            self.fell = self.value and not new_value
+            self.rose = new_value and not self.value
+            self.value = new_value
+
+    adafruit_debouncer = _Namespace()
+    adafruit_debouncer.Debouncer = _Debouncer
+    sys.modules["adafruit_debouncer"] = adafruit_debouncer
+
+    def _ticks_diff(ticks1, ticks2):
+        return (ticks1 - ticks2 + (1 << 28)) % (1 << 29) - (1 << 28)
+
+    adafruit_ticks = _Namespace()
+    adafruit_ticks.ticks_ms = lambda: 0
+    adafruit_ticks.ticks_diff = _ticks_diff
+    sys.modules["adafruit_ticks"] = adafruit_ticks
+
+import inputs
+from inputs import BankButton
+
+
+# ---------- Fakes ----------
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms
+
+
+class FakePin:
+    """DigitalInOut stand-in; value False = pressed (pull-up)."""
+    def __init__(self, value=True):
+        self.value = value
+        self.direction = None
+        self.pull = None
+
+
+clock = FakeClock()
+# inputs bound ticks_ms at import time; patch it
+inputs.ticks_ms = clock
+
+
+PASS = 0
+
+
+def check(condition, label):
+    global PASS
+    assert condition, "FAIL: " + label
+    PASS += 1
+    print("  ok -", label)
+
+
+def press(button, pin):
+    pin.value = False
+    button.update()
+
+
+def release(button, pin):
+    pin.value = True
+    button.update()
+
+
+# ---------- Tests ----------
+
+def test_held_at_startup():
+    print("button already held when constructed (e.g. at power-on)")
+    clock.now = 1000
+    pin = FakePin(value=False)
+    button = BankButton(pin)
+    check(button.update() is False, "first update on a low pin does not raise or report a change")
+    check(button._hold_time > 0, "held button reports a non-zero hold_time")
+    check(not button._double_press_detected, "no double press on the first update")
+
+
+def test_first_press_after_wrap_is_single():
+    print("first press just after ticks_ms wraps to 0 is not a double press")
+    clock.now = 100
+    pin = FakePin()
+    button = BankButton(pin)
+    press(button, pin)
+    check(button.detected_new_press, "press detected")
+    check(not button._double_press_detected, "first press is a single press")
+
+
+def test_double_press():
+    print("two presses inside DOUBLE_PRESS_TIME are a double press")
+    clock.now = 5000
+    pin = FakePin()
+    button = BankButton(pin)
+    press(button, pin)
+    clock.advance(50)
+    release(button, pin)
+    clock.advance(100)
+    press(button, pin)
+    check(button._double_press_detected, "second quick press is a double press")
+    clock.advance(50)
+    release(button, pin)
+    clock.advance(inputs._DOUBLE_PRESS_MS + 1)
+    press(button, pin)
+    check(not button._double_press_detected, "press after the window is a single press")
+
+
+if __name__ == "__main__":
+    test_held_at_startup()
+    test_first_press_after_wrap_is_single()
+    test_double_press()
+    print(f"\nAll {PASS} checks passed.")
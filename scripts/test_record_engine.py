@@ -443,6 +443,25 @@ def test_iter_all_loops_spans_sets():
     check(sets_seen == [0, 2, 5], "loops from every recorded set are yielded")
 
 
+def test_iter_playing_loops_skips_stopped():
+    print("iter_playing_loops yields only playing loops across sets")
+    mgr = fresh_manager()
+    for set_idx in (0, 3):
+        mgr.set_active_set(set_idx)
+        mgr.start_recording(0, cc_set_idx=set_idx)
+        clock.advance(10)
+        mgr.get_recording_loop().add_cc(set_idx + 1, 30, 0)
+        clock.advance(100)
+        mgr.stop_recording()
+    check(len(list(mgr.iter_playing_loops())) == 2, "both finalized loops are playing")
+    mgr.set_active_set(0)
+    mgr.toggle_playstate(0, False)
+    playing = list(mgr.iter_playing_loops())
+    check(len(playing) == 1 and playing[0].cc_set_idx == 3, "stopped loop is skipped")
+    mgr.clear_all()
+    check(list(mgr.iter_playing_loops()) == [], "nothing yielded after clear_all")
+
+
 def test_recording_global_single_across_sets():
     print("recording is global-single: switching sets finalizes the prior one")
     mgr = fresh_manager()
@@ -563,6 +582,7 @@ if __name__ == "__main__":
     # Per-set ("4 pads per bank") refactor
     test_per_set_isolation()
     test_iter_all_loops_spans_sets()
+    test_iter_playing_loops_skips_stopped()
     test_recording_global_single_across_sets()
     test_clear_all_empties_every_set()
     test_delete_only_active_set()
@@ -29,10 +29,18 @@ for pin in button_pins:
 midi_controller = MidiController(slider_pins, button_pins)
 lights_manager = LightsManager()
 lights_manager.startup_animation()
+lights_manager.set_controller(midi_controller)
 
 serial_config.set_controller(midi_controller)
 serial_config.set_midi_manager(midi_manager)
 
+# Loop invariants: the input lists are built once and never replaced, so
+# resolve them (and the per-tick sleep) once instead of every iteration.
+sliders = midi_controller.sliders
+buttons = midi_controller.buttons
+LOOP_SLEEP_S = 0.0001
+sleep = time.sleep
+
 while True:
     midi_controller.update_inputs()
     midi_controller.process_inputs()  # Runs Record Mode timers and playback pump
@@ -44,8 +52,6 @@ while True:
         lights_manager.record_mode_toggle_animation(midi_controller.record_mode_active)
 
     jump_mode_enabled = midi_controller.jump_mode_enabled
-    sliders = midi_controller.sliders
-    buttons = midi_controller.buttons
 
     if midi_controller.mapping_mode_active:
         # Mapping Mode owns the full strip; normal updates would overwrite it.
@@ -91,4 +97,4 @@ while True:
     if not midi_controller.mapping_mode_active:
         lights_manager.indicate_jump_mode(jump_mode_enabled)
     lights_manager.show_pixels()
-    time.sleep(0.0001)
\ No newline at end of file
+    sleep(LOOP_SLEEP_S)
\ No newline at end of file
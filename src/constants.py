@@ -12,7 +12,7 @@ ADAPTIVE_STABLE_THRESHOLD_CC = 3  # CC threshold when in stable mode
 ADAPTIVE_MOVING_THRESHOLD_CC = 1  # CC threshold when in moving mode
 ADAPTIVE_HOLD_DURATION = 1.0      # Time to wait before switching to stable mode (seconds)
 ADAPTIVE_SMOOTHING_FACTOR = 0.3   # Exponential smoothing factor for raw values
-ADAPTIVE_RAW_TO_CC_DIVISOR = 512  # ADC range (65536) / CC range (128)
+ADAPTIVE_RAW_TO_CC_SHIFT = 9      # ADC range (65536) / CC range (128) = 2**9
 
 MIN_CC_VALUE = 0
 MAX_CC_VALUE = 127
@@ -67,7 +67,7 @@ NUM_RECORD_CC_SETS = 1 + len(PAGES) * 4
 
 # Colors
 GLOBAL_BANK_COLOR = (200, 155, 55)  # A separate color for the global bank
-JUMP_MODE_COLOR = (255, 140, 0)     # Orange for jump mode (matches COLORS["ORANGE"])
+JUMP_MODE_COLOR = (255, 140, 0)     # Orange for jump mode (matches ORANGE)
 REG_MODE_COLOR = (0, 255, 0)        # Green for regular mode
 PAGE_INDICATOR_COLOR = (255, 255, 255)  # White for page indicator
 
@@ -88,28 +88,28 @@ RECORD_PAGE_FLASH_COLORS = [
     (255, 140, 0),    # page 4 - orange
 ]
 
-COLORS = {
-    "WHITE": (255, 255, 255),
-    "RED": (255, 0, 0),
-    "GREEN": (0, 255, 0),
-    "BLUE": (0, 0, 255),
-    "CYAN": (0, 255, 255),
-    "MAGENTA": (255, 0, 255),
-    "ORANGE": (255, 140, 0),
-    "LIME": (170, 255, 0),
-    "TEAL": (0, 128, 128),
-    "NAVY": (0, 0, 128),
-    "BROWN": (165, 42, 42),
-    "GOLD": (255, 200, 0),
-    "YELLOW": (255, 255, 0),
-    "INDIGO": (75, 0, 130),
-    "CORAL": (255, 127, 80),
-    "FUCHSIA": (255, 0, 128),
-    "TOMATO": (255, 85, 65),
-}
+# Named colors as plain module constants (no dict probe on lookup)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+CYAN = (0, 255, 255)
+MAGENTA = (255, 0, 255)
+ORANGE = (255, 140, 0)
+LIME = (170, 255, 0)
+TEAL = (0, 128, 128)
+NAVY = (0, 0, 128)
+BROWN = (165, 42, 42)
+GOLD = (255, 200, 0)
+YELLOW = (255, 255, 0)
+INDIGO = (75, 0, 130)
+CORAL = (255, 127, 80)
+FUCHSIA = (255, 0, 128)
+TOMATO = (255, 85, 65)
+
 PAGE_COLORS = [
-    [COLORS["RED"], COLORS["GREEN"], COLORS["BLUE"], COLORS["YELLOW"]],
-    [COLORS["CYAN"], COLORS["MAGENTA"], COLORS["ORANGE"], COLORS["LIME"]],
-    [COLORS["TEAL"], COLORS["NAVY"], COLORS["BROWN"], COLORS["GOLD"]],
-    [COLORS["INDIGO"], COLORS["CORAL"], COLORS["FUCHSIA"], COLORS["TOMATO"]],
+    [RED, GREEN, BLUE, YELLOW],
+    [CYAN, MAGENTA, ORANGE, LIME],
+    [TEAL, NAVY, BROWN, GOLD],
+    [INDIGO, CORAL, FUCHSIA, TOMATO],
 ]
\ No newline at end of file
@@ -8,6 +8,14 @@ from loopmanager import (LoopManager, SLOT_EMPTY, SLOT_RECORDING,
 from wiggle import SliderWiggleDetector
 import constants as cfg
 
+# Hot-path constants bound at module level to skip the cfg attribute lookup
+_MIN_CC_VALUE = cfg.MIN_CC_VALUE
+_MAX_CC_VALUE = cfg.MAX_CC_VALUE
+_CC_THRESHOLD = cfg.CC_THRESHOLD
+
+# Set-bit indices for every 4-slider change mask (e.g. 0b0101 -> (0, 2))
+_MASK_INDICES = tuple(tuple(i for i in range(4) if mask >> i & 1) for mask in range(16))
+
 class MidiController:
     def __init__(self, slider_pins, button_pins):
         self.sliders = []
@@ -19,9 +27,16 @@ class MidiController:
         self.current_page_idx = 0
         self.current_bank_idx = 0  # determined by if any buttons are held. -1 is global.
         self.held_button_order = []  # Tracks button press order; first is primary, rest are additional
+        self.held_button_mask = 0  # bit N set = button N held at last update_held_button_indices()
         self.primary_bank_idx = -1  # Derived from held_button_order[0], -1 = global
         self.additional_bank_indices = []  # Derived from held_button_order[1:]
+        # Per-slider output target at last pickup reset; None = force reset.
+        # Cleared wherever sends are suppressed while sliders can still move
+        # (Record Mode, Mapping Mode, the all-four-button hold countdown).
+        self._last_assignments = [None] * 4
         self.has_anything_changed = False
+        self.changed_slider_mask = 0  # bit N set = slider N changed CC value this tick
+        self.changed_button_mask = 0  # bit N set = button N changed state this tick
         self.locked_bank_idx = -1
         self.jump_mode_enabled = False
         self.unlock_pending = False
@@ -127,16 +142,33 @@ class MidiController:
     def setup_sliders(self):
         for idx, pin in enumerate(self.slider_pins):
             self.sliders.append(MidiSlider(pin, idx))
+        self.sliders = tuple(self.sliders)  # Fixed after setup
 
     def setup_buttons(self):
         for pin in self.button_pins:
             self.buttons.append(BankButton(pin))
+        self.buttons = tuple(self.buttons)  # Fixed after setup
 
     def update_inputs(self):
         """Update all sliders and buttons. Return True if any changed state."""
-        slider_changes = [slider.update() for slider in self.sliders]
-        button_changes = [button.update() for button in self.buttons]
-        self.has_anything_changed = any(slider_changes + button_changes)
+        # Plain loops, no short-circuit: every input must update each tick
+        # (hold timers, debouncers), and no throwaway lists on the hot path.
+        now = time.monotonic()  # one clock read shared by every slider this tick
+        slider_mask = 0
+        bit = 1
+        for slider in self.sliders:
+            if slider.update(now):
+                slider_mask |= bit
+            bit <<= 1
+        button_mask = 0
+        bit = 1
+        for button in self.buttons:
+            if button.update():
+                button_mask |= bit
+            bit <<= 1
+        self.changed_slider_mask = slider_mask
+        self.changed_button_mask = button_mask
+        self.has_anything_changed = bool(slider_mask or button_mask)
         return self.has_anything_changed
 
     def process_inputs(self):
@@ -172,27 +204,26 @@ class MidiController:
 
         self.handle_lock_changes()
 
-        top_button = self.buttons[-1]
-        middle_button_T = self.buttons[1]
-        middle_button_B = self.buttons[2]
-        bottom_button = self.buttons[0]
+        bottom_button, middle_button_T, middle_button_B, top_button = self.buttons
 
+        # Read each button's state once; several are used more than once below
         top_hold_time = top_button.hold_time
         top_was_long_held = top_button.was_long_held
         top_new_release = top_button.detected_new_release and not swallowed[3]
         top_new_press = top_button.detected_new_press
+        top_pressed = top_button.pressed
 
         bottom_hold_time = bottom_button.hold_time
         bottom_was_long_held = bottom_button.was_long_held
         bottom_new_release = bottom_button.detected_new_release and not swallowed[0]
         bottom_new_press = bottom_button.detected_new_press
-        
-        # Check if middle buttons are held (prevents bank switch when multi-bank holding)
-        middle_buttons_held = (middle_button_T.hold_time > 0) or (middle_button_B.hold_time > 0)
-        
+        bottom_pressed = bottom_button.pressed
+
+        middles_pressed = middle_button_T.pressed or middle_button_B.pressed
+
         # Check if ONLY the initiating button is held (for entering bank change mode)
-        only_bottom_held = bottom_button.pressed and not any(b.pressed for b in [top_button, middle_button_T, middle_button_B])
-        only_top_held = top_button.pressed and not any(b.pressed for b in [bottom_button, middle_button_T, middle_button_B])
+        only_bottom_held = bottom_pressed and not top_pressed and not middles_pressed
+        only_top_held = top_pressed and not bottom_pressed and not middles_pressed
 
         # Page switching logic:
         # - First switch uses release (to distinguish from multi-bank hold intent)
@@ -249,6 +280,15 @@ class MidiController:
 
     def handle_lock_changes(self):
         """Detect double-press to lock/unlock banks. In config mode, single-click locks."""
+        if not self.changed_button_mask:
+            # Slider-only tick: no press, release or double-press to act on.
+            # Only Step 1 below (arming unlock for a bank locked while every
+            # button was up, e.g. from Mapping Mode exit) can still fire.
+            if (not self.config_mode and self.locked_bank_idx != -1 and not self.unlock_pending
+                    and all(not button.pressed for button in self.buttons)):
+                self.unlock_pending = True
+            return
+
         # Check button states
         all_buttons_released = all(not button.pressed for button in self.buttons)
         any_new_button_press = any(button.detected_new_press for button in self.buttons)
@@ -329,7 +369,13 @@ class MidiController:
 
     def send_cc_messages(self):
         """Send MIDI for sliders with value changes; supports multi-channel and CC/AT types."""
-        for slider_idx, slider in enumerate(self.sliders):
+        slider_mask = self.changed_slider_mask
+        if not slider_mask:
+            return
+        sliders = self.sliders
+        for slider_idx in _MASK_INDICES[slider_mask]:
+            slider = sliders[slider_idx]
+            # A pickup reset earlier this tick (bank change) clears the flag
             if slider.cc_value_changed:
                 # Determine main channels and message type
                 if self.current_bank_idx == -1:
@@ -368,59 +414,66 @@ class MidiController:
 
     def should_send_cc(self, slider, slider_idx, channel, message_type="CC", bank_idx=-1, page_idx=None):
         """Implement pickup mode: only send after physically crossing the last sent value."""
-        cc_number = slider.current_assigned_cc_number
+        # Jump Mode always allows sending values immediately
+        if self.jump_mode_enabled:
+            return True
+
         cc_value = slider.cc_value
-        if page_idx is None:
-            page_idx = self.current_page_idx
+        crossing_cc_value = slider.crossing_cc_value
+
+        # First-time initialization of crossing values
+        if crossing_cc_value == -1:
+            slider.crossing_cc_value = cc_value
+            slider.has_crossed_last_cc_value = False
+            return False
 
         # Get last sent value based on message type
         # For AT, use per-slider tracking for independent pickup behavior
         if message_type == "AT":
+            if page_idx is None:
+                page_idx = self.current_page_idx
             last_cc_sent = midi_manager.get_last_at_value_per_slider(slider_idx, page_idx, bank_idx)
         else:
-            last_cc_sent = midi_manager.get_last_cc_value_sent(cc_number, channel)
+            last_cc_sent = midi_manager.get_last_cc_value_sent(slider.current_assigned_cc_number, channel)
 
-        # Jump Mode always allows sending values immediately
-        if self.jump_mode_enabled:
-            return True
-            
-        # First-time initialization of crossing values
-        if slider.crossing_cc_value == -1:
-            slider.crossing_cc_value = cc_value
-            slider.has_crossed_last_cc_value = False
-            return False
-            
-        # Special handling for min/max edge values
-        if last_cc_sent == cfg.MIN_CC_VALUE and cfg.MIN_CC_VALUE <= cc_value <= 2:
-            slider.has_crossed_last_cc_value = True
-            return True
-            
-        if last_cc_sent == cfg.MAX_CC_VALUE and 125 <= cc_value <= cfg.MAX_CC_VALUE:
+        # Special handling for min/max edge values (cc_value is already
+        # clamped to 0-127, so only the inner bound needs checking)
+        if (last_cc_sent == _MIN_CC_VALUE and cc_value <= 2) or (last_cc_sent == _MAX_CC_VALUE and cc_value >= 125):
             slider.has_crossed_last_cc_value = True
             return True
-            
+
         # Once crossed threshold, continue sending all values
         if slider.has_crossed_last_cc_value:
             return True
-            
+
         # Check if slider has crossed the last value from either direction
-        crossed_from_above = cc_value < last_cc_sent < slider.crossing_cc_value
-        crossed_from_below = cc_value > last_cc_sent > slider.crossing_cc_value
-        
-        if crossed_from_above or crossed_from_below:
+        if (cc_value < last_cc_sent < crossing_cc_value) or (cc_value > last_cc_sent > crossing_cc_value):
             slider.has_crossed_last_cc_value = True
             return True
-            
+
         # Skip small changes within the deadband
-        if abs(cc_value - last_cc_sent) < cfg.CC_THRESHOLD:
+        if abs(cc_value - last_cc_sent) < _CC_THRESHOLD:
             return False
-            
+
         # Update tracking value for future comparisons
         slider.crossing_cc_value = cc_value
         return False
 
     def update_held_button_indices(self):
         """Track button press order. First is primary; empty list = global mode."""
+        held_mask = 0
+        bit = 1
+        for button in self.buttons:
+            if button.pressed:
+                held_mask |= bit
+            bit <<= 1
+
+        # Order only changes when a button goes down or up, which always
+        # flips a bit in the held mask; otherwise keep the derived lists.
+        if held_mask == self.held_button_mask:
+            return self.additional_bank_indices
+        self.held_button_mask = held_mask
+
         # Add newly pressed buttons to the end of the order list
         for idx, button in enumerate(self.buttons):
             if button.detected_new_press and idx not in self.held_button_order:
@@ -428,7 +481,7 @@ class MidiController:
         
         # Remove released buttons from the order list
         self.held_button_order = [idx for idx in self.held_button_order 
-                                   if self.buttons[idx].pressed]
+                                   if held_mask & (1 << idx)]
         
         # Derive primary and additional from the order list
         if self.held_button_order:
@@ -443,7 +496,9 @@ class MidiController:
     def update_active_bank(self):
         """Set active bank from lock or primary held button; update slider CC assignments if changed."""
         previous_bank_idx = self.current_bank_idx
-        previous_additional_indices = list(self.additional_bank_indices)
+        # additional_bank_indices is rebuilt, never mutated, so holding the
+        # old reference is enough to compare against (no copy needed)
+        previous_additional_indices = self.additional_bank_indices
 
         self.update_held_button_indices()
 
@@ -452,39 +507,59 @@ class MidiController:
         else:
             self.current_bank_idx = self.primary_bank_idx
 
-        # Reassign CC numbers if we switched banks or changed held-button indices
+        # Reassign CC numbers if we switched banks or changed held-button indices.
+        # Not the raw held mask: presses consumed by page navigation never
+        # enter held_button_order and must not trigger a reassignment.
         if (previous_bank_idx != self.current_bank_idx 
             or previous_additional_indices != self.additional_bank_indices):
             self.update_slider_cc_assignments()
 
     def update_slider_cc_assignments(self):
-        """Assign primary and additional CC numbers from held buttons; reset pickup tracking."""
-        current_cc_bank = self.get_current_cc_bank()
+        """Assign primary and additional CC numbers from held buttons; reset pickup tracking for changed or invalidated targets."""
+        page_idx = self.current_page_idx
+        bank_idx = self.current_bank_idx
+        additional_bank_indices = self.additional_bank_indices
+
+        if bank_idx == -1:
+            primary_bank = self.global_cc_lookup
+        else:
+            page = self.cc_lookup[page_idx]
+            primary_bank = page[bank_idx]
+            current_type = self.type_lookup[page_idx][bank_idx]
+            bank_channels = self.channel_lookup[page_idx][bank_idx]
 
         for idx, slider in enumerate(self.sliders):
             # Step 1: Assign primary CC number
-            if self.current_bank_idx == -1:
+            slider.current_assigned_cc_number = primary_bank[idx]
+            if bank_idx == -1:
                 # Global bank
-                slider.current_assigned_cc_number = cfg.GLOBAL_CC_BANK[idx]
                 slider.additional_assigned_cc_numbers = []
                 current_channel = self.global_slider_channels[idx][0]
                 current_type = self.global_message_type
             else:
-                # Bank from current group
-                slider.current_assigned_cc_number = current_cc_bank[idx]
-                current_channel = self.channel_lookup[self.current_page_idx][self.current_bank_idx][idx][0]
-                current_type = self.type_lookup[self.current_page_idx][self.current_bank_idx]
+                current_channel = bank_channels[idx][0]
 
                 # Step 2: Add any secondary CC assignments from additional held buttons
-                if self.additional_bank_indices:
-                    slider.additional_assigned_cc_numbers = self.get_additional_cc_numbers(idx)
+                if additional_bank_indices:
+                    slider.additional_assigned_cc_numbers = [page[b][idx] for b in additional_bank_indices]
                 else:
                     slider.additional_assigned_cc_numbers = []
 
-            # Step 3: Reset pickup mode tracking to prevent unwanted jumps
+            # Step 3: Reset pickup mode tracking to prevent unwanted jumps,
+            # unless this slider's output target is unchanged since the last
+            # reset and no muted window invalidated it in between (AT pickup
+            # is tracked per slider/page/bank, so those are part of it)
+            if current_type == "AT":
+                assignment = ("AT", page_idx, bank_idx)
+            else:
+                assignment = (slider.current_assigned_cc_number, current_channel)
+            if assignment == self._last_assignments[idx]:
+                continue
+            self._last_assignments[idx] = assignment
+
             # Use appropriate last value based on message type (per-slider for AT)
             if current_type == "AT":
-                last_sent = midi_manager.get_last_at_value_per_slider(idx, self.current_page_idx, self.current_bank_idx)
+                last_sent = midi_manager.get_last_at_value_per_slider(idx, page_idx, bank_idx)
             else:
                 last_sent = midi_manager.get_last_cc_value_sent(slider.current_assigned_cc_number, current_channel)
             slider.crossing_cc_value = last_sent
@@ -502,9 +577,21 @@ class MidiController:
 
         self.pages = cfg.PAGES
 
+        self.setup_cc_lookup()
+
         # Default global CC assignments
         for idx, slider in enumerate(self.sliders):
-            slider.current_assigned_cc_number = self.global_cc_bank[idx]
+            slider.current_assigned_cc_number = self.global_cc_lookup[idx]
+
+    def setup_cc_lookup(self):
+        """Snapshot CC banks into flat tuples for bank-switch reassignment."""
+        # cc_lookup[page_idx][bank_idx][slider_idx] = CC number. Mapping Mode
+        # edits the settings lists in place, so rebuild after every learn.
+        self.global_cc_lookup = tuple(self.global_cc_bank)
+        self.cc_lookup = tuple(
+            tuple(tuple(bank) for bank in page)
+            for page in self.pages
+        )
 
     def setup_channel_lookup(self):
         """Precompute MIDI channel and message-type lookup tables for pages, banks, sliders."""
@@ -532,18 +619,6 @@ class MidiController:
             for page in range(4)
         ]
 
-    def get_current_cc_bank(self):
-        if self.current_bank_idx == -1:
-            return self.global_cc_bank
-        return self.pages[self.current_page_idx][self.current_bank_idx]
-
-    def get_additional_cc_numbers(self, idx):
-        additional_cc_numbers = []
-        for button_idx in self.additional_bank_indices:
-            bank = self.pages[self.current_page_idx][button_idx]
-            additional_cc_numbers.append(bank[idx])
-        return additional_cc_numbers
-
     def next_page(self):
         """Move to next page (no wrap); enter page-change mode."""
         current_time = time.monotonic()
@@ -677,6 +752,10 @@ class MidiController:
         """Detect the hold-all-four-buttons-for-3s Record Mode toggle."""
         if not all(button.pressed for button in self.buttons):
             self._disarm_global_wiggle()
+            if self._mode_hold_start != 0:
+                # Sends were muted during the countdown while sliders may have
+                # moved; force a pickup reset on the next reassignment.
+                self._last_assignments = [None] * 4
             self._mode_hold_start = 0
             self._mode_hold_fired = False
             return
@@ -684,6 +763,8 @@ class MidiController:
         if self.config_mode:
             # All-four hold is ignored while the web config is connected
             self._disarm_global_wiggle()
+            if self._mode_hold_start != 0:
+                self._last_assignments = [None] * 4  # Countdown muted sends; see above
             self._mode_hold_start = 0
             return
 
@@ -742,6 +823,7 @@ class MidiController:
         # clean in the other mode
         self.unlock_bank()
         self.held_button_order = []
+        self.held_button_mask = 0
         self.primary_bank_idx = -1
         self.additional_bank_indices = []
         self.unlock_pending = False
@@ -894,13 +976,13 @@ class MidiController:
         """Resolve active record CC set. Returns (cc_number, channels, message_type, bank_idx, page_idx)."""
         set_idx = self.record_cc_set_idx
         if set_idx == 0:
-            return (cfg.GLOBAL_CC_BANK[slider_idx],
+            return (self.global_cc_lookup[slider_idx],
                     self.global_slider_channels[slider_idx],
                     self.global_message_type,
                     -1, 0)
         page_idx = (set_idx - 1) // 4
         bank_idx = (set_idx - 1) % 4
-        return (self.pages[page_idx][bank_idx][slider_idx],
+        return (self.cc_lookup[page_idx][bank_idx][slider_idx],
                 self.channel_lookup[page_idx][bank_idx][slider_idx],
                 self.type_lookup[page_idx][bank_idx],
                 bank_idx, page_idx)
@@ -908,6 +990,9 @@ class MidiController:
     def update_record_slider_assignments(self):
         """Record-mode CC assignment: assign from active set, reset pickup tracking."""
         for idx, slider in enumerate(self.sliders):
+            # Normal-mode assignments are overwritten here; force a full
+            # pickup reset when update_slider_cc_assignments runs again.
+            self._last_assignments[idx] = None
             cc_number, channels, message_type, bank_idx, page_idx = self._record_set_lookup(idx)
             slider.current_assigned_cc_number = cc_number
             slider.additional_assigned_cc_numbers = []
@@ -1091,15 +1176,17 @@ class MidiController:
 
     def process_loop_playback(self):
         """Playback pump: collect and send due events from all loops in all sets."""
-        for loop in self.loop_manager.iter_all_loops():
+        send_cc = midi_manager.send_cc
+        send_aftertouch = midi_manager.send_aftertouch
+        for loop in self.loop_manager.iter_playing_loops():
             events = loop.get_new_events()
             if not events:
                 continue
             new_cc, new_at = events
             for cc_number, value, channel in new_cc:
-                midi_manager.send_cc([(cc_number, channel)], value)
+                send_cc([(cc_number, channel)], value)
             for _, pressure, channel in new_at:
-                midi_manager.send_aftertouch([channel], pressure)
+                send_aftertouch([channel], pressure)
 
     def _stop_loop_with_reset(self, slot_idx):
         """Stop slot's loop; if cc_reset enabled, snap to first values."""
@@ -1290,6 +1377,7 @@ class MidiController:
         # Hard-reset normal-mode gesture state so stale presses/releases can't
         # fire once Mapping Mode exits (mirrors _toggle_record_mode).
         self.held_button_order = []
+        self.held_button_mask = 0
         self.primary_bank_idx = -1
         self.additional_bank_indices = []
         self.unlock_pending = False
@@ -1378,8 +1466,9 @@ class MidiController:
             _, page_idx, bank_idx = scope
             applied = settings.set_bank_slider_mapping(page_idx, bank_idx, slider_idx, cc_number, channel, persist=False)
 
-        # CC numbers propagate via aliasing; channels are
-        # precomputed copies and need an explicit rebuild.
+        # CC numbers and channels are precomputed copies and need an
+        # explicit rebuild.
+        self.setup_cc_lookup()
         self.setup_channel_lookup()
         gc.collect()
 
@@ -1413,8 +1502,10 @@ class MidiController:
         self._reset_learn_accumulator()
 
         # Lift the output kill-switch now that learning is over (normal sends
-        # resume on the next fader move).
+        # resume on the next fader move). Sliders moved freely while muted
+        # (wiggle gesture), so every slider needs a fresh pickup reset.
         midi_manager.output_muted = False
+        self._last_assignments = [None] * 4
 
         for detector in self._wiggle_detectors:
             detector.disarm()
@@ -1424,6 +1515,7 @@ class MidiController:
             self.lock_bank(bank_idx)
         else:
             self.held_button_order = []
+            self.held_button_mask = 0
             self.primary_bank_idx = -1
             self.additional_bank_indices = []
             self.update_active_bank()
@@ -1,8 +1,24 @@
 import digitalio
 import time
 from adafruit_debouncer import Debouncer
+from adafruit_ticks import ticks_ms, ticks_diff
 import constants as cfg
 
+# Adaptive smoothing is fixed point so the math stays in small ints: the
+# smoothed raw value carries _SMOOTH_FRAC_BITS fraction bits and the factor
+# is scaled by 256 (0.3 -> 77/256). Worst case |delta| * factor is
+# (65536 << 4) * 256 = 2**28, inside the small-int range.
+_SMOOTH_FRAC_BITS = 4
+_SMOOTHING_Q8 = int(cfg.ADAPTIVE_SMOOTHING_FACTOR * 256 + 0.5)
+_RAW_TO_CC_SHIFT = cfg.ADAPTIVE_RAW_TO_CC_SHIFT + _SMOOTH_FRAC_BITS
+_STABLE_THRESHOLD_CC = cfg.ADAPTIVE_STABLE_THRESHOLD_CC
+_MOVING_THRESHOLD_CC = cfg.ADAPTIVE_MOVING_THRESHOLD_CC
+_HOLD_DURATION = cfg.ADAPTIVE_HOLD_DURATION
+
+# Button timing in integer ms
+_DOUBLE_PRESS_MS = int(cfg.DOUBLE_PRESS_TIME * 1000)
+_LONG_HOLD_THRESH_MS = int(cfg.LONG_HOLD_THRESH_S * 1000)
+
 class MidiSlider:
     def __init__(self, analog_pin, slider_index):
         self.analog_pin = analog_pin
@@ -19,70 +35,62 @@ class MidiSlider:
         self.adaptive_state = "CHANGING"  # "STABLE" or "CHANGING"
         self.adaptive_last_cc_sent = -1  # Initialize to invalid value to force first send
         self.adaptive_last_cc_send_time = time.monotonic()  # Track when we last sent a CC
-        self.adaptive_smoothed_raw = 0  # Exponentially smoothed raw value
+        self.adaptive_smoothed_raw = 0  # Exponentially smoothed raw value, fixed point (<< _SMOOTH_FRAC_BITS)
 
-    def update(self):
-        """Read analog, apply adaptive smoothing, calculate CC. Return True if changed."""
-        self.current_value = 65536 - self.analog_pin.value
+    def update(self, now):
+        """Read analog, apply adaptive smoothing, calculate CC. Return True if changed.
 
-        # Apply exponential smoothing to the raw value
-        if self.adaptive_smoothed_raw == 0:  # Initialize on first read
-            self.adaptive_smoothed_raw = self.current_value
+        `now` is the caller's time.monotonic() for this tick, shared by all sliders.
+        """
+        current_value = 65536 - self.analog_pin.value
+        self.current_value = current_value
+
+        # Apply exponential smoothing to the raw value (integer-only)
+        current_fixed = current_value << _SMOOTH_FRAC_BITS
+        smoothed = self.adaptive_smoothed_raw
+        if smoothed == 0:  # Initialize on first read
+            smoothed = current_fixed
         else:
-            self.adaptive_smoothed_raw = (
-                cfg.ADAPTIVE_SMOOTHING_FACTOR * self.current_value
-                + (1 - cfg.ADAPTIVE_SMOOTHING_FACTOR) * self.adaptive_smoothed_raw
-            )
+            smoothed += ((current_fixed - smoothed) * _SMOOTHING_Q8) >> 8
+        self.adaptive_smoothed_raw = smoothed
 
         # Convert smoothed raw value to CC
-        adaptive_cc_value = int(self.adaptive_smoothed_raw / cfg.ADAPTIVE_RAW_TO_CC_DIVISOR)
-        adaptive_cc_value = max(0, min(127, adaptive_cc_value))  # Clamp to valid range
+        # Raw is always positive (65536 - pin), so only the top needs clamping
+        adaptive_cc_value = smoothed >> _RAW_TO_CC_SHIFT
+        if adaptive_cc_value > 127:
+            adaptive_cc_value = 127
+
+        # Adaptive state machine (inlined; runs per slider every tick).
+        # Threshold depends on the current state; transitions are based on
+        # actual CC message activity.
+        if self.adaptive_state == "STABLE":
+            should_send_cc = abs(adaptive_cc_value - self.adaptive_last_cc_sent) >= _STABLE_THRESHOLD_CC
+            # Switch to CHANGING immediately when we need to send a CC message
+            if should_send_cc:
+                self.adaptive_state = "CHANGING"
+        else:
+            should_send_cc = abs(adaptive_cc_value - self.adaptive_last_cc_sent) >= _MOVING_THRESHOLD_CC
+            # Switch to STABLE only if we haven't sent a CC message for the hold duration
+            if now - self.adaptive_last_cc_send_time >= _HOLD_DURATION:
+                self.adaptive_state = "STABLE"
 
-        # Update adaptive state and check if we should send CC
-        if self._update_adaptive_state(adaptive_cc_value):
+        if should_send_cc:
             self.cc_value = adaptive_cc_value
             self.cc_value_changed = True
             self.adaptive_last_cc_sent = adaptive_cc_value
-            self.adaptive_last_cc_send_time = time.monotonic()
+            self.adaptive_last_cc_send_time = now
         else:
             self.cc_value_changed = False
 
         return self.cc_value_changed
 
-    def _update_adaptive_state(self, cc_value):
-        """Update adaptive state; return True if CC should be sent."""
-        current_time = time.monotonic()
-
-        # Determine threshold based on current state
-        if self.adaptive_state == "STABLE":
-            threshold = cfg.ADAPTIVE_STABLE_THRESHOLD_CC
-        else:
-            threshold = cfg.ADAPTIVE_MOVING_THRESHOLD_CC
-
-        # Check if we should send CC message
-        cc_diff = abs(cc_value - self.adaptive_last_cc_sent)
-        should_send_cc = cc_diff >= threshold
-
-        # State machine logic - base transitions on actual CC message activity
-        if self.adaptive_state == "CHANGING":
-            # Switch to STABLE only if we haven't sent a CC message for the hold duration
-            time_since_last_cc = current_time - self.adaptive_last_cc_send_time
-            if time_since_last_cc >= cfg.ADAPTIVE_HOLD_DURATION:
-                self.adaptive_state = "STABLE"
-        elif self.adaptive_state == "STABLE":
-            # Switch to CHANGING immediately when we need to send a CC message
-            if should_send_cc:
-                self.adaptive_state = "CHANGING"
-
-        return should_send_cc
-
 class BankButton:
     def __init__(self, digital_pin):
         self.digital_pin = digital_pin
         self.digital_pin.direction = digitalio.Direction.INPUT
         self.digital_pin.pull = digitalio.Pull.UP
         self.button = Debouncer(self.digital_pin)
-        self._last_press_time = 0
+        self._last_press_time = None  # None = never pressed
         self._hold_time = 0
         self._is_long_held = False
         self._was_long_held = False
@@ -99,7 +107,7 @@ class BankButton:
         self.detected_new_press = False
         self._double_press_detected = False
         self._was_long_held = False
-        current_time = time.monotonic()
+        current_time = ticks_ms()
 
         new_press = self.button.fell
         new_release = self.button.rose
@@ -107,12 +115,13 @@ class BankButton:
 
         # Button just pressed
         if new_press:
-            if (current_time - self._last_press_time) <= cfg.DOUBLE_PRESS_TIME:
-                self._double_press_detected = True
-            else:
-                self._double_press_detected = False
+            last_press_time = self._last_press_time
+            self._double_press_detected = (
+                last_press_time is not None
+                and 0 <= ticks_diff(current_time, last_press_time) <= _DOUBLE_PRESS_MS
+            )
             self._last_press_time = current_time
-            self._hold_time = 0.01
+            self._hold_time = 1
             state_changed = True
             self.detected_new_press = True
 
@@ -127,8 +136,14 @@ class BankButton:
         # Button state did not change
         else:
             if currently_pressed:
-                self._hold_time = current_time - self._last_press_time
-                if self._hold_time >= cfg.LONG_HOLD_THRESH_S and not self._is_long_held:
+                # Held since before the first update (e.g. held at power-on):
+                # Debouncer never reports fell, so start timing the hold now.
+                if self._last_press_time is None:
+                    self._last_press_time = current_time
+                # Ticks are whole ms and the loop can run several times per ms;
+                # a held button must never read as 0 (= released).
+                self._hold_time = ticks_diff(current_time, self._last_press_time) or 1
+                if self._hold_time >= _LONG_HOLD_THRESH_MS and not self._is_long_held:
                     self._is_long_held = True
             else:
                 self._hold_time = 0
@@ -144,7 +159,7 @@ class BankButton:
 
     @property
     def hold_time(self):
-        """Duration button has been held (seconds)."""
+        """Duration button has been held (ms); 0 when released."""
         return self._hold_time
 
     @property
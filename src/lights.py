@@ -3,9 +3,11 @@ import storage
 import neopixel
 import time
 from midi import midi_manager
-from settings import settings
 import constants as cfg
 
+# Button colors while page change mode hides them
+_ALL_BUTTONS_OFF = ((0, 0, 0),) * 4
+
 class LightsManager:
     # Pixel 0-3: buttons; 4-67: slider bars (16 pixels each); 68: indicator pixel above sliders
     def __init__(self, num_pixels=69, pixel_pin=board.GP15, brightness=0.2):
@@ -20,25 +22,38 @@ class LightsManager:
         self.pixels.fill((0, 0, 0))
         self.pixels.show()
 
-        # Button-to-pixel mapping
-        self.button_pixel_indices = {
-            0: 0,   # Bottom-left button
-            1: 1,
-            2: 2,
-            3: 3,   # Buttons mapped to pixels 0-3
-        }
-
-        # Slider-to-pixel mapping
-        self.slider_pixel_indices = {
-            0: list(range(4, 20)),   # Slider 1 pixels (4-19) - total 16
-            1: list(range(20, 36)),  # Slider 2 pixels (20-35) - total 16
-            2: list(range(36, 52)),  # Slider 3 pixels (36-51) - total 16
-            3: list(range(52, 68)),  # Slider 4 pixels (52-67) - total 16
-        }
+        # Drawing goes into _frame; show_pixels() pushes it to the strip only
+        # when it differs from _shown (the last frame actually written out).
+        # The main loop redraws every pixel every tick, so most ticks change
+        # nothing and the blocking strip refresh can be skipped.
+        self._frame = [(0, 0, 0)] * self.num_pixels
+        self._shown = [(0, 0, 0)] * self.num_pixels
+        self._blank = [(0, 0, 0)] * self.num_pixels
+
+        # What each slider bar was last drawn with (lit pixel count, color);
+        # update_slider_lights skips bars whose inputs are unchanged. -1 means
+        # the bar must be redrawn (reset by clear()).
+        self._bar_lit = [-1] * 4
+        self._bar_color = [None] * 4
+
+        # Button-to-pixel mapping, indexed by button (0 = bottom-left)
+        self.button_pixel_indices = (0, 1, 2, 3)  # Buttons mapped to pixels 0-3
+
+        # Slider-to-pixel mapping, indexed by slider
+        self.slider_pixel_indices = (
+            tuple(range(4, 20)),   # Slider 1 pixels (4-19) - total 16
+            tuple(range(20, 36)),  # Slider 2 pixels (20-35) - total 16
+            tuple(range(36, 52)),  # Slider 3 pixels (36-51) - total 16
+            tuple(range(52, 68)),  # Slider 4 pixels (52-67) - total 16
+        )
 
         # Indicator pixel above sliders
         self.indicator_pixel_index = 68
 
+        # Controller whose precomputed channel/type tables drive the slider
+        # LEDs; must be set via set_controller before update_slider_lights
+        self._controller = None
+
         # Multi-bank morphing state
         self.morph_start_time = 0
         self.morph_cycle_duration = 3.0  # seconds for full cycle through all colors
@@ -46,22 +61,32 @@ class LightsManager:
 
         # Default state
         self.clear()
-        self.pixels[self.indicator_pixel_index] = cfg.REG_MODE_COLOR
+        self._frame[self.indicator_pixel_index] = cfg.REG_MODE_COLOR
+
+    def set_controller(self, controller):
+        """Set reference to controller for its channel/message-type lookup tables."""
+        self._controller = controller
 
     def clear(self):
         """Set all pixels to black/off."""
-        self.pixels.fill((0, 0, 0))
+        self._frame[:] = self._blank
+        self._bar_lit = [-1] * 4
 
     def update_slider_lights(self, sliders, bank_idx=0, page_idx=0, held_button_order=None, page_just_changed=False):
-        """Update slider LEDs for current positions. Morph colors in multi-bank mode."""
+        """Update slider LEDs for current positions (sliders are MidiSlider objects). Morph colors in multi-bank mode."""
         if held_button_order is None:
             held_button_order = []
         
         # Message type remains bank/page/global scoped; channel lookup is per-slider.
+        # Read the controller's precomputed tables (the same ones CC sends use)
+        # instead of re-resolving settings for every slider every frame.
+        controller = self._controller
         if bank_idx == -1:
-            message_type = settings.get_global_message_type()
+            message_type = controller.global_message_type
+            slider_channels = controller.global_slider_channels
         else:
-            message_type = settings.get_resolved_message_type(page_idx, bank_idx)
+            message_type = controller.type_lookup[page_idx][bank_idx]
+            slider_channels = controller.channel_lookup[page_idx][bank_idx]
         
         # Check for multi-bank mode and handle morphing
         # Disable morphing during page navigation to avoid false triggers
@@ -75,41 +100,54 @@ class LightsManager:
         
         # Get color (morphed if multi-bank, solid otherwise)
         morphed_color = self._get_morphed_color(held_button_order, page_idx) if is_multi_bank else None
-        
+
+        # Bind the last-sent lookups and drawing targets once for all sliders
+        last_cc_sent = midi_manager.get_last_cc_value_sent
+        last_at_sent = midi_manager.get_last_at_value_per_slider
+        slider_pixel_indices = self.slider_pixel_indices
+        frame = self._frame
+        bar_lit = self._bar_lit
+        bar_color = self._bar_color
+
+        # Determine color based on bank/global/multi-bank morph (same for every slider)
+        if morphed_color is not None:
+            color = morphed_color
+        elif bank_idx == -1:
+            color = cfg.GLOBAL_BANK_COLOR
+        else:
+            color = cfg.PAGE_COLORS[page_idx][bank_idx]
+
         for slider_idx, slider in enumerate(sliders):
-            # Obtain the CC value (0-127)
-            slider_cc_value = slider.cc_value if hasattr(slider, 'cc_value') else slider
+            slider_cc_value = slider.cc_value  # 0-127
 
             # Get last sent value based on message type (per-slider for AT)
             if message_type == "AT":
-                last_sent_cc_value = midi_manager.get_last_at_value_per_slider(slider_idx, page_idx, bank_idx)
+                last_sent_cc_value = last_at_sent(slider_idx, page_idx, bank_idx)
             else:
-                if bank_idx == -1:
-                    channel = settings.get_resolved_global_slider_channels(slider_idx)[0]
-                else:
-                    channel = settings.get_resolved_slider_channels(page_idx, bank_idx, slider_idx)[0]
-                last_sent_cc_value = midi_manager.get_last_cc_value_sent(slider.current_assigned_cc_number, channel)
+                channel = slider_channels[slider_idx][0]
+                last_sent_cc_value = last_cc_sent(slider.current_assigned_cc_number, channel)
             
             if abs(slider_cc_value - last_sent_cc_value) > cfg.SLIDER_LIGHT_PICKUP_THRESHOLD:
                 cc_value = last_sent_cc_value
             else:
                 cc_value = slider_cc_value
 
-            num_pixels = len(self.slider_pixel_indices[slider_idx])
+            pixel_indices = slider_pixel_indices[slider_idx]
+            num_pixels = len(pixel_indices)
             lit_pixels = int((cc_value / 127) * num_pixels)
-            pixel_indices = self.slider_pixel_indices[slider_idx]
 
-            # Determine color based on bank/global/multi-bank morph
-            if morphed_color is not None:
-                color = morphed_color
-            elif bank_idx == -1:
-                color = cfg.GLOBAL_BANK_COLOR
-            else:
-                color = cfg.PAGE_COLORS[page_idx][bank_idx]
+            # Bar already shows this level in this color; nothing to redraw
+            if lit_pixels == bar_lit[slider_idx] and color == bar_color[slider_idx]:
+                continue
+            bar_lit[slider_idx] = lit_pixels
+            bar_color[slider_idx] = color
 
-            # Light up pixels according to the CC value
-            for i, pix_idx in enumerate(pixel_indices):
-                self.pixels[pix_idx] = color if i < lit_pixels else (0, 0, 0)
+            # Light up pixels according to the CC value. Each bar is a
+            # contiguous run, so write the lit and dark parts as two slices.
+            start = pixel_indices[0]
+            split = start + lit_pixels
+            frame[start:split] = [color] * lit_pixels
+            frame[split:start + num_pixels] = [(0, 0, 0)] * (num_pixels - lit_pixels)
 
     def _get_morphed_color(self, held_button_order, page_idx):
         """Return interpolated color for multi-bank morph, or None."""
@@ -146,27 +184,28 @@ class LightsManager:
             return
         
         if page_change_feedback is None:
-            page_change_feedback = {'page_change_mode': False, 'blink_button_idx': -1, 'blink_off': False}
-        
-        page_change_mode = page_change_feedback.get('page_change_mode', False)
-        blink_idx = page_change_feedback.get('blink_button_idx', -1)
-        blink_off = page_change_feedback.get('blink_off', False)
-        
+            page_change_mode, blink_idx, blink_off = False, -1, False
+        else:
+            page_change_mode = page_change_feedback.get('page_change_mode', False)
+            blink_idx = page_change_feedback.get('blink_button_idx', -1)
+            blink_off = page_change_feedback.get('blink_off', False)
+
+        frame = self._frame
+        button_pixel_indices = self.button_pixel_indices
+        # In page change mode, hide all button colors
+        colors = _ALL_BUTTONS_OFF if page_change_mode else cfg.PAGE_COLORS[page_idx]
+
         any_button_pressed = False
-        pressed_button_indices = set()
+        indicator_button_pressed = False  # Is the button under the page indicator held?
 
         for idx, button in enumerate(buttons):
-            pixel_index = self.button_pixel_indices.get(idx)
             if button.pressed:
-                # In page change mode, hide all button colors
-                if page_change_mode:
-                    self.pixels[pixel_index] = (0, 0, 0)
-                else:
-                    self.pixels[pixel_index] = cfg.PAGE_COLORS[page_idx][idx]
+                frame[button_pixel_indices[idx]] = colors[idx]
                 any_button_pressed = True
-                pressed_button_indices.add(idx)
+                if idx == page_idx:
+                    indicator_button_pressed = True
             else:
-                self.pixels[pixel_index] = (0, 0, 0)
+                frame[button_pixel_indices[idx]] = (0, 0, 0)
 
         # Show page indicator if:
         # - No buttons are pressed, OR
@@ -175,22 +214,22 @@ class LightsManager:
         if not any_button_pressed or page_just_changed or page_change_mode:
             indicator_idx = page_idx
             # In page change mode, always show the indicator regardless of which buttons pressed
-            show_indicator = page_change_mode or indicator_idx not in pressed_button_indices
+            show_indicator = page_change_mode or not indicator_button_pressed
             
             if show_indicator:
                 # Check if we should blink this pixel (at page limit)
                 if indicator_idx == blink_idx and blink_off:
-                    self.pixels[indicator_idx] = (0, 0, 0)
+                    frame[indicator_idx] = (0, 0, 0)
                 else:
-                    self.pixels[indicator_idx] = cfg.PAGE_INDICATOR_COLOR
+                    frame[indicator_idx] = cfg.PAGE_INDICATOR_COLOR
 
     def indicate_locked_bank(self, page_idx, locked_bank_idx):
         """Light the button LED for the locked bank."""
-        for idx, pix_idx in self.button_pixel_indices.items():
+        for idx, pix_idx in enumerate(self.button_pixel_indices):
             if idx == locked_bank_idx:
-                self.pixels[pix_idx] = cfg.PAGE_COLORS[page_idx][locked_bank_idx]
+                self._frame[pix_idx] = cfg.PAGE_COLORS[page_idx][locked_bank_idx]
             else:
-                self.pixels[pix_idx] = (0, 0, 0)
+                self._frame[pix_idx] = (0, 0, 0)
 
     def update_record_mode_buttons(self, slot_states, set_flash=-1, reject=(-1, False)):
         """Draw Record Mode slot states on buttons. Overlay set flash and reject blink."""
@@ -198,32 +237,32 @@ class LightsManager:
         for idx, state in enumerate(slot_states):
             pixel_index = self.button_pixel_indices[idx]
             if state == "recording":
-                self.pixels[pixel_index] = cfg.RECORD_RECORDING_COLOR
+                self._frame[pixel_index] = cfg.RECORD_RECORDING_COLOR
             elif state == "delete_armed":
                 blink_on = int(now / cfg.RECORD_DELETE_BLINK_S) % 2 == 0
-                self.pixels[pixel_index] = cfg.RECORD_RECORDING_COLOR if blink_on else (0, 0, 0)
+                self._frame[pixel_index] = cfg.RECORD_RECORDING_COLOR if blink_on else (0, 0, 0)
             elif state == "playing":
-                self.pixels[pixel_index] = cfg.RECORD_PLAYING_COLOR
+                self._frame[pixel_index] = cfg.RECORD_PLAYING_COLOR
             elif state == "stopped":
-                self.pixels[pixel_index] = cfg.RECORD_STOPPED_COLOR
+                self._frame[pixel_index] = cfg.RECORD_STOPPED_COLOR
             else:  # empty
-                self.pixels[pixel_index] = (0, 0, 0)
+                self._frame[pixel_index] = (0, 0, 0)
 
         # CC-set navigation flash (overlays the slot states): light the landed
         # set's bank button in the page color; the global set blanks all four.
         if set_flash == 0:
             for idx in range(4):
-                self.pixels[self.button_pixel_indices[idx]] = (0, 0, 0)
+                self._frame[self.button_pixel_indices[idx]] = (0, 0, 0)
         elif set_flash > 0:
             bank = (set_flash - 1) % 4
             page = (set_flash - 1) // 4
-            self.pixels[self.button_pixel_indices[bank]] = cfg.RECORD_PAGE_FLASH_COLORS[page]
+            self._frame[self.button_pixel_indices[bank]] = cfg.RECORD_PAGE_FLASH_COLORS[page]
 
         # Low-memory record-reject blink (overlays everything): red on / off on
         # the refused pad for ~3 cycles.
         reject_slot, reject_on = reject
         if reject_slot != -1:
-            self.pixels[self.button_pixel_indices[reject_slot]] = (
+            self._frame[self.button_pixel_indices[reject_slot]] = (
                 cfg.RECORD_RECORDING_COLOR if reject_on else (0, 0, 0))
 
     def update_mapping_mode(self, target_slider_idx, confirm_slider_idx, confirm_active,
@@ -235,24 +274,28 @@ class LightsManager:
 
         if target_slider_idx != -1:
             color = cfg.MAPPING_COLOR if blink_on else (0, 0, 0)
-            for pix_idx in self.slider_pixel_indices[target_slider_idx]:
-                self.pixels[pix_idx] = color
+            self._fill_slider_bar(target_slider_idx, color)
 
         if confirm_active and confirm_slider_idx != -1:
             confirm_color = cfg.MAPPING_FAIL_COLOR if confirm_failed else cfg.MAPPING_CONFIRM_COLOR
-            for pix_idx in self.slider_pixel_indices[confirm_slider_idx]:
-                self.pixels[pix_idx] = confirm_color
+            self._fill_slider_bar(confirm_slider_idx, confirm_color)
 
         # Bank scope keeps the locked bank's button solid at its normal color;
         # global scope leaves all four dark (handled by bank_button_idx == -1).
         for idx in range(4):
             if idx == bank_button_idx:
-                self.pixels[self.button_pixel_indices[idx]] = cfg.PAGE_COLORS[bank_page_idx][idx]
+                self._frame[self.button_pixel_indices[idx]] = cfg.PAGE_COLORS[bank_page_idx][idx]
             else:
-                self.pixels[self.button_pixel_indices[idx]] = (0, 0, 0)
+                self._frame[self.button_pixel_indices[idx]] = (0, 0, 0)
 
         # Indicator pixel ("top LED") blinks blue in sync for the whole session.
-        self.pixels[self.indicator_pixel_index] = cfg.MAPPING_COLOR if blink_on else (0, 0, 0)
+        self._frame[self.indicator_pixel_index] = cfg.MAPPING_COLOR if blink_on else (0, 0, 0)
+
+    def _fill_slider_bar(self, slider_idx, color):
+        """Set every pixel of one slider bar to color."""
+        pixel_indices = self.slider_pixel_indices[slider_idx]
+        start = pixel_indices[0]
+        self._frame[start:start + len(pixel_indices)] = [color] * len(pixel_indices)
 
     def update_mode_hold_progress(self, pixels_lit):
         """
@@ -264,7 +307,7 @@ class LightsManager:
             pixels_lit (int): Number of pixels to light (0-4).
         """
         for idx in range(min(pixels_lit, 4)):
-            self.pixels[self.button_pixel_indices[idx]] = cfg.RECORD_RECORDING_COLOR
+            self._frame[self.button_pixel_indices[idx]] = cfg.RECORD_RECORDING_COLOR
 
     def record_mode_toggle_animation(self, entering):
         """
@@ -276,16 +319,16 @@ class LightsManager:
         """
         order = [0, 1, 2, 3] if entering else [3, 2, 1, 0]
         for idx in range(4):
-            self.pixels[self.button_pixel_indices[idx]] = (0, 0, 0)
-        self.pixels.show()
+            self._frame[self.button_pixel_indices[idx]] = (0, 0, 0)
+        self.show_pixels(force=True)
         for idx in order:
-            self.pixels[self.button_pixel_indices[idx]] = cfg.RECORD_RECORDING_COLOR
-            self.pixels.show()
+            self._frame[self.button_pixel_indices[idx]] = cfg.RECORD_RECORDING_COLOR
+            self.show_pixels(force=True)
             time.sleep(0.06)
         time.sleep(0.06)
         for idx in range(4):
-            self.pixels[self.button_pixel_indices[idx]] = (0, 0, 0)
-        self.pixels.show()
+            self._frame[self.button_pixel_indices[idx]] = (0, 0, 0)
+        self.show_pixels(force=True)
 
     def indicate_jump_mode(self, enabled):
         """
@@ -294,11 +337,14 @@ class LightsManager:
         Args:
             enabled (bool): True if jump mode is enabled, False otherwise.
         """
-        self.pixels[self.indicator_pixel_index] = cfg.JUMP_MODE_COLOR if enabled else cfg.REG_MODE_COLOR
+        self._frame[self.indicator_pixel_index] = cfg.JUMP_MODE_COLOR if enabled else cfg.REG_MODE_COLOR
 
-    def show_pixels(self):
-        """Write pixel state to NeoPixel strip."""
-        self.pixels.show()
+    def show_pixels(self, force=False):
+        """Write the drawn frame to the NeoPixel strip if it changed (or if forced)."""
+        if force or self._frame != self._shown:
+            self.pixels[:] = self._frame
+            self.pixels.show()
+            self._shown[:] = self._frame
 
     def startup_animation(self):
         """Play rainbow animation on startup; red blinks if read-only."""
@@ -327,7 +373,13 @@ class LightsManager:
             else:
                 pos -= 170
                 return (pos * 3, 0, 255 - pos * 3)
-        
+
+        # Precompute every wheel color and each pixel's position offset so a
+        # frame is just table lookups. Locals, so the table is freed after
+        # the (startup-only) animation.
+        wheel_colors = tuple(wheel(pos) for pos in range(256))
+        offsets = [i * 256 * cycles // self.num_pixels for i in range(self.num_pixels)]
+
         start_time = time.monotonic()
         try:
             while True:
@@ -339,16 +391,14 @@ class LightsManager:
                     # Check time limit within the inner loop too
                     if duration is not None and (time.monotonic() - start_time) > duration:
                         break
-                        
-                    for i in range(self.num_pixels):
-                        # Distribute the colors evenly across the strip with multiple cycles
-                        position = (i * 256 * cycles // self.num_pixels + j) % 256
-                        self.pixels[i] = wheel(position)
-                    self.show_pixels()
+
+                    # Distribute the colors evenly across the strip with multiple cycles
+                    self.pixels[:] = [wheel_colors[(offset + j) % 256] for offset in offsets]
+                    self.pixels.show()
                     time.sleep(speed)
         except KeyboardInterrupt:
             pass
             
-        # Clean up after animation ends
+        # Clean up after animation ends (the animation bypassed the frame)
         self.clear()
-        self.show_pixels()
\ No newline at end of file
+        self.show_pixels(force=True)
\ No newline at end of file
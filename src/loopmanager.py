@@ -50,6 +50,13 @@ class LoopManager:
                 if loop is not None:
                     yield loop
 
+    def iter_playing_loops(self):
+        """Yield only loops that are playing (playback pump skips silent pads)."""
+        for slots in self.loops_by_set.values():
+            for loop in slots:
+                if loop is not None and loop.loop_is_playing:
+                    yield loop
+
     # ==================== Queries ====================
 
     def slot_has_loop(self, slot_idx):
@@ -8,11 +8,17 @@ import usb_midi
 MIDI_AUX_TX_PIN = board.GP16
 MIDI_AUX_RX_PIN = board.GP17
 
+# Marks a (cc_number, channel) slot in last_cc_values_sent that has never been
+# sent; real CC values are 0-127 so it can never match one.
+_CC_NEVER_SENT = 0xFF
+
 class MidiManager:
     def __init__(self):
-        # Track last CC values by (cc_number, channel) tuple
-        # This allows different channels to track independently
-        self.last_cc_values_sent = {}
+        # Track last CC values per (cc_number, channel), flattened to one byte
+        # per slot at index channel * 128 + cc_number. This allows different
+        # channels to track independently without allocating a tuple key per
+        # lookup.
+        self.last_cc_values_sent = bytearray([_CC_NEVER_SENT]) * (16 * 128)
         
         # Track last aftertouch values by channel only
         # (Channel Aftertouch is one value per channel, no CC number)
@@ -53,6 +59,12 @@ class MidiManager:
             debug=False,
         )
 
+        # CC output bypasses adafruit_midi: each CC is serialized once into
+        # this reused 3-byte packet and the same bytes go to both ports.
+        self._usb_midi_out = usb_midi.ports[1]
+        self._trs_midi_out = uart
+        self._cc_packet = bytearray(3)
+
     def receive_cc(self):
         """Check for incoming CC from USB or TRS MIDI. Returns (cc_number, channel) or None; channel is 1-indexed."""
         # Check USB MIDI
@@ -99,27 +111,38 @@ class MidiManager:
 
     def has_cc_value_changed(self, cc_number, channel, cc_value):
         """True if cc_value differs from last sent on this (cc_number, channel), or never sent before."""
-        key = (cc_number, channel)
-        return self.last_cc_values_sent.get(key, -1) != cc_value
+        if cc_number < 0:  # Slider not assigned a CC yet; nothing to send
+            return False
+        return self.last_cc_values_sent[(channel << 7) | cc_number] != cc_value
 
     def send_cc(self, cc_list_with_channels, cc_value):
         """Send CC messages for all (cc_number, channel) tuples, but only if value changed."""
         if self.output_muted:
             return
+        last_cc_values_sent = self.last_cc_values_sent
+        usb_out = self._usb_midi_out
+        trs_out = self._trs_midi_out
+        packet = self._cc_packet
+        packet[2] = cc_value
         for cc_number, channel in cc_list_with_channels:
-            if self.has_cc_value_changed(cc_number, channel, cc_value):
-                key = (cc_number, channel)
-                self.last_cc_values_sent[key] = cc_value
-                cc_msg = ControlChange(cc_number, cc_value, channel=channel)
-                # Send each message individually to preserve its channel
-                # (MIDI.send() overwrites channel when sending lists)
-                self.midi.send(cc_msg, channel=channel)
-                self.trs_midi.send(cc_msg, channel=channel)
+            if cc_number < 0:  # Slider not assigned a CC yet; (channel << 7) | -1 would alias slot -1
+                continue
+            slot = (channel << 7) | cc_number
+            if last_cc_values_sent[slot] != cc_value:
+                last_cc_values_sent[slot] = cc_value
+                # Control Change: status 0xB0 | channel, control number, value.
+                # One packet per CC so each keeps its own channel.
+                packet[0] = 0xB0 | channel
+                packet[1] = cc_number
+                usb_out.write(packet)
+                trs_out.write(packet)
 
     def get_last_cc_value_sent(self, cc_number, channel):
         """Return last CC value sent for (cc_number, channel), or 16 if never sent."""
-        key = (cc_number, channel)
-        return self.last_cc_values_sent.get(key, 16)
+        if cc_number < 0:  # Slider not assigned a CC yet
+            return 16
+        value = self.last_cc_values_sent[(channel << 7) | cc_number]
+        return 16 if value == _CC_NEVER_SENT else value
     
     # ==================== Aftertouch Methods ====================
     